@@ -1,5 +1,5 @@
 """
-This script standardises data from a Parquet file using a combination of Ibis and Polars for efficient data processing.
+This script standardises data from a Parquet file using Ibis on DuckDB for efficient data processing.
 
 It performs the following operations:
 
@@ -17,10 +17,11 @@ Input/Output:
 """
 
 import logging
+import os
 from datetime import datetime
 
 import ibis  # type: ignore
-import polars as pl
+import pyarrow.parquet as pq
 
 from include import standardise as std  # type: ignore
 
@@ -38,15 +39,37 @@ NULL_VALUES = ["NULL", "N/A", ""]
 # These columns will be converted to a consistent ISO timestamp format
 TIMESTAMP_COLUMNS = ["date_column"]
 
+# Columns that identify a row for deduplication
+# When set, one whole row is kept per key. Which row is kept is arbitrary, as insertion order is not preserved.
+# When None, rows are deduplicated on every column
+DEDUP_KEYS: list[str] | None = None
+
 # File paths for input and output data
 # Relative paths from the project root directory
 INPUT_FILEPATH = "files/input.parquet"
 OUTPUT_FILEPATH = "files/output.parquet"
 
+# DuckDB settings applied to the connection before any data is read
+# Caching Parquet metadata saves re-reading the footer on each scan of the input file, and dropping insertion order
+# lets the deduplication and export run as parallel pipelines. Output row order is not guaranteed
+DUCKDB_SETTINGS = {
+    "threads": os.cpu_count() or 1,
+    "memory_limit": "8GB",
+    "preserve_insertion_order": False,
+    "parquet_metadata_cache": True,
+}
+
+# Parquet writer options for the output file
+# DuckDB streams the query into the file one row group at a time, so this bounds the write buffer
+OUTPUT_ROW_GROUP_SIZE = 122880
+OUTPUT_COMPRESSION = "zstd"
+
 
 if __name__ == "__main__":
     try:
         con = ibis.duckdb.connect()
+        for setting, value in DUCKDB_SETTINGS.items():
+            con.raw_sql(f"SET {setting} = {value!r}")
         table = con.read_parquet(INPUT_FILEPATH)
     except Exception as e:
         logging.error(f"Error reading in Parquet file: {e}")
@@ -58,10 +81,16 @@ if __name__ == "__main__":
     except Exception as e:
         logging.error(f"Error renaming columns to snake_case: {e}")
 
+    # Resolve the string columns once so later steps don't each walk the schema
+    string_cols = [col for col, dtype in table.schema().items() if dtype.is_string()]
+
     # 2. Basic null/empty value handling
     try:
+        # Only string columns can hold NULL_VALUES, so other columns pass through untouched
         case_exprs = [
-            ibis.case().when(table[col].cast("string").isin(NULL_VALUES), ibis.null()).else_(table[col]).end().name(col)
+            ibis.cases((table[col].isin(NULL_VALUES), ibis.null()), else_=table[col]).name(col)
+            if col in string_cols
+            else table[col]
             for col in table.columns
         ]
         table_expr = table.select(*case_exprs)
@@ -77,15 +106,27 @@ if __name__ == "__main__":
 
     # 4. String cleansing and normalisation
     try:
-        table_expr = std.standardise_strings(table_expr)
+        # Timestamp columns are no longer strings once normalised
+        table_expr = std.standardise_strings(
+            table_expr, string_cols=[col for col in string_cols if col not in TIMESTAMP_COLUMNS]
+        )
     except Exception as e:
         logging.error(f"Error standardising strings: {e}")
 
     # 5. Simple deduplication
     try:
-        before_dedup = len(table_expr.execute())
-        table_expr = table_expr.distinct()
-        after_dedup = len(table_expr.execute())
+        # Row counts are computed as scalar COUNT(*) queries so the pipeline is never materialised in Python
+        before_dedup = int(table_expr.count().execute())
+        if DEDUP_KEYS:
+            # Number the rows within each key and keep one, so every output row is a whole input row
+            table_expr = (
+                table_expr.mutate(dedup_row_number=ibis.row_number().over(group_by=DEDUP_KEYS))
+                .filter(ibis._.dedup_row_number == 0)
+                .drop("dedup_row_number")
+            )
+        else:
+            table_expr = table_expr.distinct()
+        after_dedup = int(table_expr.count().execute())
         logging.info(f"Deduplicated rows: {before_dedup - after_dedup}")
     except Exception as e:
         logging.error(f"Error during deduplication: {e}")
@@ -93,23 +134,30 @@ if __name__ == "__main__":
     # 6. Dataset metadata tagging
     try:
         table_expr = table_expr.mutate(
-            standardise_timestamp=ibis.literal(datetime.now().isoformat(sep=" ", timespec="seconds")).try_cast(
-                "timestamp"
-            ),
+            standardise_timestamp=ibis.literal(datetime.now().replace(microsecond=0), type="timestamp"),
             data_source=ibis.literal("UNSPECIFIED"),
         )
     except Exception as e:
         logging.error(f"Error tagging metadata: {e}")
 
     try:
-        table_expr.to_parquet(OUTPUT_FILEPATH)
+        # Compiles to a single DuckDB COPY ... TO statement, which writes the result from DuckDB straight to the file
+        table_expr.to_parquet(
+            OUTPUT_FILEPATH,
+            row_group_size=OUTPUT_ROW_GROUP_SIZE,
+            compression=OUTPUT_COMPRESSION,
+        )
         logging.info("Successfully cleansed data and exported.")
     except Exception as e:
-        logging.error(f"Error writing Parquet file with Ibis/Polars: {e}")
+        logging.error(f"Error writing Parquet file with Ibis: {e}")
 
+    # Summarise the output from its Parquet footer rather than reading the data back in
     try:
-        df_output_ibis_polars = pl.read_parquet(OUTPUT_FILEPATH)
-        logging.info("\nCleaned Data (Ibis/Polars - Snake Case):")
-        logging.info(df_output_ibis_polars)
+        output_metadata = pq.read_metadata(OUTPUT_FILEPATH)
+        logging.info(
+            f"Output: {output_metadata.num_rows} rows, {output_metadata.num_columns} columns, "
+            f"{output_metadata.num_row_groups} row groups"
+        )
+        logging.info(f"Output schema:\n{output_metadata.schema.to_arrow_schema()}")
     except Exception as e:
-        logging.error(f"Error reading output Parquet file with Polars: {e}")
+        logging.error(f"Error reading output Parquet metadata: {e}")
@@ -5,18 +5,19 @@ Functions:
 ---------
     standardise_strings: Standardises string columns by trimming whitespace, converting to uppercase, and normalising Unicode characters.
     normalise_unicode_string: Normalises Unicode strings by handling diacritics and non-Latin characters while preserving special characters like macrons.
-    normalise_unicode: Wrapper that registers the Unicode normalisation function as an Ibis UDF.
+    normalise_unicode_batch: Applies the same Unicode normalisation to a whole Arrow string array with vectorised kernels.
     normalise_timestamps: Converts timestamp columns to a consistent ISO-8601 format.
 """
 
 import logging
-import re
 import unicodedata as uni
 from datetime import datetime
 from typing import Any
 
 import ibis  # type: ignore
-import ibis.selectors as sel  # type: ignore
+import pyarrow as pa
+import pyarrow.compute as pc
+import regex
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,8 +25,37 @@ logging.basicConfig(
     datefmt="%y-%m-%d %H:%M:%S",
 )
 
+# Macron vowels kept when removing non-Latin characters
+MACRONS = "āēīōūĀĒĪŌŪ"
+_MACRON_CODEPOINTS = frozenset(map(ord, MACRONS))
 
-def standardise_strings(table_expr: Any) -> Any:
+# Match any character outside basic Latin range, except keep macrons
+NON_LATIN_PATTERN = rf"[^\x00-\xFF{MACRONS}]"
+
+# Match non-spacing marks (the decomposed diacritics) and control characters
+DIACRITIC_CONTROL_PATTERN = r"[\p{Mn}\p{C}]"
+
+# Precompiled for scalar use so each string is filtered in a single C-level scan
+_DIACRITIC_CONTROL_RE = regex.compile(DIACRITIC_CONTROL_PATTERN)
+
+
+class _NonLatinTable(dict[int, int | None]):
+    """str.translate table that deletes non-Latin code points except macrons, filled in as code points are seen."""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        mapped = None if codepoint > 0xFF and codepoint not in _MACRON_CODEPOINTS else codepoint
+        self[codepoint] = mapped
+        return mapped
+
+
+_NON_LATIN_TABLE = _NonLatinTable()
+
+# Fallback formats for timestamp strings that DuckDB cannot cast directly, tried in order
+# Dates are assumed to be day-first, so "02/01/2024" parses as 2 January 2024
+TIMESTAMP_FORMATS = ["%d/%m/%Y %H:%M:%S", "%d/%m/%Y", "%d-%m-%Y", "%Y%m%d"]
+
+
+def standardise_strings(table_expr: Any, string_cols: list[str] | None = None, batch_size: int = 1_000_000) -> Any:
     """
      Standardise string columns by trimming whitespace, converting to uppercase, and normalising Unicode.
 
@@ -34,8 +64,19 @@ def standardise_strings(table_expr: Any) -> Any:
     2. Converts text to uppercase for consistent comparison
     3. Normalises Unicode characters (removes diacritics, handles special characters)
 
+    The table is streamed from DuckDB as Arrow record batches and the transformations run in pyarrow.compute's
+    vectorised string kernels. Python holds only one batch at a time, and columns whose types do not survive the
+    Arrow round trip are cast back. A column that cannot be processed is logged and left unchanged.
+
+    The result is written to a new, non-temporary table on the table's backend, named
+    ``ibis_standardised_strings_*``. It lives as long as the database, so callers on a file-backed connection
+    should drop it once they are done with it.
+
     Args:
         table_expr (ibis.expr.types.Table): The input Ibis table expression.
+        string_cols (Optional[List[str]]): Precomputed list of string column names. If None, the string columns
+            are resolved from the table's schema.
+        batch_size (int): Maximum number of rows per Arrow record batch.
 
     Returns:
         ibis.expr.types.Table: The table with standardised string columns.
@@ -46,19 +87,76 @@ def standardise_strings(table_expr: Any) -> Any:
 
     """
     try:
-        string_columns = table_expr.select(sel.of_type("string")).columns
-        for col in string_columns:
-            try:
-                table_expr = table_expr.mutate(**{col: table_expr[col].strip().upper()})
-                table_expr = table_expr.mutate(**{col: normalise_unicode(table_expr[col])})
-            except Exception as e:
-                logging.error(f"Error processing column {col}: {e}")
-        return table_expr
+        if string_cols is None:
+            string_cols = [col for col, dtype in table_expr.schema().items() if dtype.is_string()]
+        if not string_cols:
+            return table_expr
+
+        # Stream the query result straight from DuckDB, bypassing Ibis' Arrow type conversion, which fails on some
+        # types (e.g. INTERVAL). Python only ever holds a single batch
+        con = table_expr.get_backend()
+        batches = con.raw_sql(con.compile(table_expr)).fetch_record_batch(batch_size)
+
+        # Dictionary-encoded strings (e.g. DuckDB ENUMs) are decoded so the string kernels apply
+        schema = batches.schema
+        for col in string_cols:
+            field = schema.field(col)
+            if pa.types.is_dictionary(field.type):
+                schema = schema.set(schema.get_field_index(col), field.with_type(field.type.value_type))
+        supported_cols = []
+        for col in string_cols:
+            if pa.types.is_string(schema.field(col).type) or pa.types.is_large_string(schema.field(col).type):
+                supported_cols.append(col)
+            else:
+                logging.error(f"Error processing column {col}: unsupported Arrow type {schema.field(col).type}")
+
+        standardised = pa.RecordBatchReader.from_batches(
+            schema, (_standardise_string_batch(batch, supported_cols, schema) for batch in batches)
+        )
+
+        # DuckDB ingests the batches into a new table as they are produced. This runs on a separate cursor because
+        # the batches are still being read from the backend's own connection, which also means the table cannot be
+        # temporary (temporary tables are only visible to the cursor that created them)
+        table_name = ibis.util.gen_name("standardised_strings")
+        cursor = con.con.cursor()
+        try:
+            cursor.from_arrow(standardised).create(table_name)
+        finally:
+            cursor.close()
+
+        # Restore types that have no Arrow equivalent (e.g. UUID and JSON arrive back as strings)
+        result = con.table(table_name)
+        result_schema = result.schema()
+        drifted = {
+            col: dtype
+            for col, dtype in table_expr.schema().items()
+            if dtype.copy(nullable=True) != result_schema[col].copy(nullable=True)
+        }
+        return result.cast(drifted) if drifted else result
     except Exception as e:
         logging.error(f"Error in standardise_strings: {e}")
         return table_expr
 
 
+def _standardise_string_batch(batch: Any, string_cols: list[str], schema: Any) -> Any:
+    """Trim, uppercase and normalise the string columns of a single Arrow record batch."""
+    arrays = []
+    for col, arr in zip(batch.schema.names, batch.columns, strict=True):
+        if pa.types.is_dictionary(arr.type) and not pa.types.is_dictionary(schema.field(col).type):
+            arr = arr.dictionary_decode()
+        if col in string_cols:
+            try:
+                trimmed = pc.utf8_trim_whitespace(arr)
+                # ASCII-only columns can use a byte-wise uppercase, and uppercasing keeps them ASCII
+                is_ascii = _is_ascii(trimmed)
+                upper = pc.ascii_upper(trimmed) if is_ascii else pc.utf8_upper(trimmed)
+                arr = normalise_unicode_batch(upper, is_ascii=is_ascii)
+            except Exception as e:
+                logging.error(f"Error processing column {col}: {e}")
+        arrays.append(arr)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
 def normalise_unicode_string(text: str) -> str:
     """
     Normalise a Unicode string by handling diacritics and non-Latin characters.
@@ -82,65 +180,78 @@ def normalise_unicode_string(text: str) -> str:
     """
     if text is None:
         return None
+    # Printable ASCII has no non-Latin characters, diacritics or control characters to remove
+    if text.isascii() and text.isprintable():
+        return text
     try:
-        # Remove non-Latin characters except macrons
-        def replace_non_latin(match: Any) -> str:
-            char = str(match.group(0))
-            # Keep macrons (ā, ē, ī, ō, ū, Ā, Ē, Ī, Ō, Ū)
-            if char in "āēīōūĀĒĪŌŪ":
-                return char
-            else:
-                return ""
-
-        # Match any character outside basic Latin range, except keep macrons
-        text = re.sub(r"[^\x00-\xFF]", replace_non_latin, text)
-        # Normalise to decompose diacritic characters
-        normalised_text = uni.normalize("NFKD", text)
-        # Filter out non-spacing marks (the decomposed diacritics)
-        without_diacritics = "".join(c for c in normalised_text if uni.category(c) != "Mn")
-        # Remove control characters
-        cleaned_text = "".join(c for c in without_diacritics if uni.category(c)[0] != "C")
+        # Remove non-Latin characters except macrons, then decompose diacritic characters
+        normalised_text = uni.normalize("NFKD", text.translate(_NON_LATIN_TABLE))
+        # Remove non-spacing marks (the decomposed diacritics) and control characters
+        cleaned_text: str = _DIACRITIC_CONTROL_RE.sub("", normalised_text)
         return cleaned_text
     except Exception as e:
         logging.error(f"Error in normalise_unicode_string for text '{text}': {e}")
         return text
 
 
-@ibis.udf.scalar.python
-def normalise_unicode(text: str) -> str:
+def normalise_unicode_batch(arr: Any, is_ascii: bool | None = None) -> Any:
     """
-    Ibis UDF wrapper for Unicode normalisation function.
+    Normalise an Arrow string array by handling diacritics and non-Latin characters.
 
-    This registers the string normalisation function as a user-defined function
-    that can be used within Ibis expressions.
+    This is the vectorised counterpart of normalise_unicode_string, operating on the Arrow string buffers with
+    pyarrow.compute kernels rather than one Python string at a time.
 
     Args:
-        text (Optional[str]): The input string to normalise.
+        arr (pyarrow.Array | pyarrow.ChunkedArray): The string array to normalise. Nulls are preserved.
+        is_ascii (Optional[bool]): Whether every value in the array is already known to be ASCII. If None, the
+            array is scanned to find out.
 
     Returns:
-        Optional[str]: The normalised string.
+        pyarrow.Array | pyarrow.ChunkedArray: The normalised string array.
+
+    Example:
+        >>> normalise_unicode_batch(pa.array(["Café", "Māori", None]))
+        ["Cafe", "Maori", null]
     """
-    try:
-        return normalise_unicode_string(text)
-    except Exception as e:
-        logging.error(f"Error in normalise_unicode UDF: {e}")
-        return text
+    if is_ascii is None:
+        is_ascii = _is_ascii(arr)
+    # ASCII has no non-Latin characters or diacritics, so only control characters need removing
+    if not is_ascii:
+        arr = pc.replace_substring_regex(arr, NON_LATIN_PATTERN, "")
+        arr = pc.utf8_normalize(arr, form="NFKD")
+    return pc.replace_substring_regex(arr, DIACRITIC_CONTROL_PATTERN, "")
+
 
+def _is_ascii(arr: Any) -> bool:
+    """Check whether every non-null value in an Arrow string array is ASCII."""
+    return bool(pc.all(pc.string_is_ascii(arr)).as_py())
 
-def normalise_timestamps(table_expr: Any, timestamp_columns: list[str]) -> Any:
+
+@ibis.udf.scalar.builtin(name="try_strptime")
+def _try_strptime(value: str, formats: list[str]) -> datetime:  # type: ignore[empty-body]
+    """DuckDB's native TRY_STRPTIME, which returns the first format that parses or NULL if none do."""
+    ...
+
+
+def normalise_timestamps(
+    table_expr: Any, timestamp_columns: list[str], timestamp_formats: list[str] | None = None
+) -> Any:
     """
     Normalise timestamp columns to ISO-8601 format.
 
-    This function attempts to convert various date/time formats to a consistent timestamp representation using Ibis' try_cast functionality. This ensures all datetime values follow a consistent standard.
+    This function attempts to convert various date/time formats to a consistent timestamp representation using Ibis' try_cast functionality. String values that cannot be cast directly are parsed against a list of known formats with DuckDB's strptime. This ensures all datetime values follow a consistent standard.
 
     Args:
         table_expr (ibis.expr.types.Table): The input Ibis table expression.
         timestamp_columns (List[str]): List of column names to normalise as timestamps.
+        timestamp_formats (Optional[List[str]]): strptime formats to try when a direct cast fails. Defaults to
+            TIMESTAMP_FORMATS.
 
     Returns:
         ibis.expr.types.Table: The table with normalised timestamp columns.
 
     Notes:
+        - Columns that are already timestamps are passed through unchanged
         - Columns that cannot be converted will maintain their original format
         - Errors during conversion are logged but won't stop processing
 
@@ -148,17 +259,24 @@ def normalise_timestamps(table_expr: Any, timestamp_columns: list[str]) -> Any:
         >>> table = ibis.table([('date_col', 'string'), ('created_at', 'string')])
         >>> with_timestamps = normalise_timestamps(table, ['date_col', 'created_at'])
     """
+    if timestamp_formats is None:
+        timestamp_formats = TIMESTAMP_FORMATS
     try:
+        # Build every output column up front so all casts land in a single projection
+        exprs = {col: table_expr[col] for col in table_expr.columns}
         for col in timestamp_columns:
-            if col in table_expr.columns:
+            # Columns already typed as timestamps are left as they are
+            if col in exprs and not table_expr[col].type().is_timestamp():
                 try:
-                    table_expr = table_expr.mutate(**{col: table_expr[col].try_cast("timestamp")})
+                    exprs[col] = table_expr[col].try_cast("timestamp")
+                    if table_expr[col].type().is_string() and timestamp_formats:
+                        exprs[col] = ibis.coalesce(exprs[col], _try_strptime(table_expr[col], timestamp_formats))
                 except Exception as e:
                     logging.error(
                         f"Warning: Could not normalise timestamp format for column '{col}'. "
                         f"Ensure the column contains valid timestamp data. Error: {e}"
                     )
-        return table_expr
+        return table_expr.select(**exprs)
     except Exception as e:
         logging.error(f"Error in normalise_timestamps: {e}")
         return table_expr
@@ -0,0 +1,71 @@
+"""Tests for the string standardisation in include.standardise."""
+
+import ibis  # type: ignore
+import pytest
+
+from include import standardise as std  # type: ignore
+
+
+@pytest.fixture
+def con():
+    """In-memory DuckDB backend."""
+    return ibis.duckdb.connect()
+
+
+def test_standardise_strings_cleans_string_columns(con):
+    """Strings are trimmed, uppercased and stripped of diacritics; nulls are kept."""
+    con.raw_sql("CREATE TABLE src AS SELECT * FROM (VALUES ('  café '), ('Māori'), (NULL)) AS t(name)")
+
+    result = std.standardise_strings(con.table("src")).execute()
+
+    assert result["name"].tolist()[:2] == ["CAFE", "MAORI"]
+    assert result["name"].isna().tolist()[2]
+
+
+def test_standardise_strings_restores_types_lost_in_arrow(con):
+    """UUID and JSON columns come back with their original types."""
+    con.raw_sql("CREATE TABLE src AS SELECT uuid() AS id, '{}'::JSON AS payload, ' café ' AS name FROM range(3)")
+    table = con.table("src")
+
+    result = std.standardise_strings(table)
+
+    assert result.schema() == table.schema()
+    assert result.execute()["name"].tolist() == ["CAFE"] * 3
+
+
+def test_standardise_strings_keeps_interval_and_enum_columns(con):
+    """INTERVAL and ENUM columns survive the Arrow round trip."""
+    con.raw_sql("CREATE TYPE mood AS ENUM (' happé ', 'sad')")
+    con.raw_sql(
+        "CREATE TABLE src AS SELECT ' café ' AS name, INTERVAL 1 MONTH AS wait, ' happé '::mood AS mood FROM range(3)"
+    )
+    table = con.table("src")
+
+    result = std.standardise_strings(table)
+
+    assert result.schema() == table.schema()
+    df = result.execute()
+    assert df["name"].tolist() == ["CAFE"] * 3
+    assert df["mood"].tolist() == ["HAPPE"] * 3
+
+
+def test_standardise_strings_handles_multiple_batches(con):
+    """Every row is standardised when the input spans several record batches."""
+    con.raw_sql("CREATE TABLE src AS SELECT range AS n, ' é' || range::VARCHAR AS name FROM range(10000)")
+
+    result = std.standardise_strings(con.table("src"), batch_size=2048)
+
+    assert result.count().execute() == 10000
+    assert result.filter(result.name == "E9999").count().execute() == 1
+    assert result.filter(~result.name.startswith("E")).count().execute() == 0
+
+
+def test_standardise_strings_handles_empty_input(con):
+    """An empty table comes back empty with its schema intact."""
+    con.raw_sql("CREATE TABLE src AS SELECT uuid() AS id, 'x' AS name FROM range(0)")
+    table = con.table("src")
+
+    result = std.standardise_strings(table)
+
+    assert result.count().execute() == 0
+    assert result.schema() == table.schema()